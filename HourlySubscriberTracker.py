@@ -4,21 +4,43 @@ update(hour: int, value: int): Increment the element at index hour by value.
 query(start: int, end: int): Retrieve the number of subscribers that have signed up between start and end (inclusive).
 You can assume that all values get cleared at the end of the day, and that you will not be asked for start and end values that wrap around midnight.
 """
+from itertools import accumulate
+from numbers import Number
+
 class HourlySubscriberTracker:
     def __init__(self):
         self.subscribers = [0] * 24  # Initialize an array of 24 hours
+        self.prefix = None  # Cumulative sums, rebuilt lazily after an update
 
     def update(self, hour: int, value: int):
         """Increment the element at index hour by value."""
         if 0 <= hour < 24:
             self.subscribers[hour] += value
+            self.prefix = None
         else:
             raise ValueError("Hour must be between 0 and 23.")
 
+    def update_many(self, hours, values):
+        """Increment several hours at once, invalidating the prefix sums only once."""
+        pairs = list(zip(hours, values, strict=True))
+        # Validate the whole batch first, so a bad item leaves the tracker untouched
+        for hour, value in pairs:
+            if not isinstance(hour, int):
+                raise TypeError("Hour must be an int.")
+            if not 0 <= hour < 24:
+                raise ValueError("Hour must be between 0 and 23.")
+            if not isinstance(value, Number):
+                raise TypeError("Value must be a number.")
+        self.prefix = None
+        for hour, value in pairs:
+            self.subscribers[hour] += value
+
     def query(self, start: int, end: int) -> int:
         """Retrieve the number of subscribers that have signed up between start and end (inclusive)."""
         if 0 <= start <= end < 24:
-            return sum(self.subscribers[start:end+1])
+            if self.prefix is None:
+                self.prefix = list(accumulate(self.subscribers, initial=0))
+            return self.prefix[end+1] - self.prefix[start]
         else:
             raise ValueError("Start and end must be between 0 and 23, and start must be <= end.")
 
@@ -28,4 +50,8 @@ tracker.update(5, 10)
 tracker.update(10, 20)
 tracker.update(15, 30)
 print(tracker.query(5, 10))  # Output: 30
-print(tracker.query(10, 15)) # Output: 50
\ No newline at end of file
+print(tracker.query(10, 15)) # Output: 50
+
+tracker.update_many([5, 15], [1, 2])
+print(tracker.query(5, 10))  # Output: 31
+print(tracker.query(10, 15)) # Output: 52
\ No newline at end of file
@@ -7,6 +7,8 @@
 from collections import defaultdict, OrderedDict
 
 class Node:
+    __slots__ = ('key', 'value', 'freq')
+
     def __init__(self, key, value):
         self.key = key
         self.value = value
@@ -21,19 +23,22 @@ class LFUCache:
     
     def _update_freq(self, node: Node):
         """Helper function to update the frequency of a node."""
-        del self.freq_map[node.freq][node.key]
-        if not self.freq_map[node.freq]:
-            del self.freq_map[node.freq]
-            if node.freq == self.min_freq:
+        freq_map = self.freq_map
+        freq = node.freq
+        bucket = freq_map[freq]
+        del bucket[node.key]
+        if not bucket:
+            del freq_map[freq]
+            if freq == self.min_freq:
                 self.min_freq += 1
         
-        node.freq += 1
-        self.freq_map[node.freq][node.key] = node
+        node.freq = freq + 1
+        freq_map[freq + 1][node.key] = node
     
     def get(self, key: int) -> int:
-        if key not in self.data:
+        node = self.data.get(key)
+        if node is None:
             return None
-        node = self.data[key]
         self._update_freq(node)
         return node.value
     
@@ -41,21 +46,24 @@ class LFUCache:
         if self.capacity == 0:
             return
         
-        if key in self.data:
-            node = self.data[key]
+        data = self.data
+        node = data.get(key)
+        if node is not None:
             node.value = value
             self._update_freq(node)
         else:
-            if len(self.data) >= self.capacity:
+            freq_map = self.freq_map
+            if len(data) >= self.capacity:
                 # Evict least frequently used node
-                lfu_key, lfu_node = self.freq_map[self.min_freq].popitem(last=False)
-                del self.data[lfu_key]
-                if not self.freq_map[self.min_freq]:
-                    del self.freq_map[self.min_freq]
+                bucket = freq_map[self.min_freq]
+                lfu_key, lfu_node = bucket.popitem(last=False)
+                del data[lfu_key]
+                if not bucket:
+                    del freq_map[self.min_freq]
             
             new_node = Node(key, value)
-            self.data[key] = new_node
-            self.freq_map[1][key] = new_node
+            data[key] = new_node
+            freq_map[1][key] = new_node
             self.min_freq = 1
 
 # Testing LFUCache
@@ -1,14 +1,21 @@
 import logging
+from logging.handlers import QueueHandler, QueueListener, MemoryHandler
 from datetime import datetime
+import atexit
+import queue
 import csv
 
 # === Setup Logging to File and Console ===
 logger = logging.getLogger("CalculatorLogger")
 logger.setLevel(logging.DEBUG)
 
-# File Handler
+# File Handler (written from a background listener, buffered in memory)
 file_handler = logging.FileHandler("calculator.log", mode='w')
 file_handler.setLevel(logging.DEBUG)
+buffered_file_handler = MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=file_handler)
+log_queue = queue.Queue(-1)
+queue_handler = QueueHandler(log_queue)
+queue_listener = QueueListener(log_queue, buffered_file_handler)
 
 # Console Handler
 console_handler = logging.StreamHandler()
@@ -20,9 +27,13 @@ file_handler.setFormatter(formatter)
 console_handler.setFormatter(formatter)
 
 # Add Handlers to Logger
-logger.addHandler(file_handler)
+logger.addHandler(queue_handler)
 logger.addHandler(console_handler)
 
+# Drain the queue on exit; logging's own shutdown then flushes the memory buffer to the file
+queue_listener.start()
+atexit.register(queue_listener.stop)
+
 # === Calculator Class ===
 class Calculator:
     def __init__(self):
@@ -34,26 +45,26 @@ class Calculator:
 
     def add(self, a, b):
         result = a + b
-        logger.info(f"Addition: {a} + {b} = {result}")
+        logger.info("Addition: %s + %s = %s", a, b, result)
         self._log_history(a, b, '+', result)
         return result
 
     def subtract(self, a, b):
         result = a - b
-        logger.info(f"Subtraction: {a} - {b} = {result}")
+        logger.info("Subtraction: %s - %s = %s", a, b, result)
         self._log_history(a, b, '-', result)
         return result
 
     def multiply(self, a, b):
         result = a * b
-        logger.info(f"Multiplication: {a} * {b} = {result}")
+        logger.info("Multiplication: %s * %s = %s", a, b, result)
         self._log_history(a, b, '*', result)
         return result
 
     def divide(self, a, b):
         try:
             result = a / b
-            logger.info(f"Division: {a} / {b} = {result}")
+            logger.info("Division: %s / %s = %s", a, b, result)
             self._log_history(a, b, '/', result)
             return result
         except ZeroDivisionError:
@@ -72,17 +83,17 @@ def run_calculator():
     inputs = [(10, 5), (7, 0), (3, 4), (12, 6), ('a', 2)]
 
     for op_name in operations:
+        method = getattr(calc, op_name)
         for a, b in inputs:
             try:
                 a_val = float(a)
                 b_val = float(b)
-                method = getattr(calc, op_name)
                 result = method(a_val, b_val)
                 print(f"[{datetime.now().strftime('%H:%M:%S')}] {op_name.capitalize()} of {a_val} and {b_val} = {result}")
             except ValueError:
-                logger.warning(f"Invalid input: {a}, {b}")
+                logger.warning("Invalid input: %s, %s", a, b)
             except Exception as e:
-                logger.critical(f"Unexpected error: {e}")
+                logger.critical("Unexpected error: %s", e)
 
     print("\n=== Operation History ===")
     calc.print_history()
@@ -9,48 +9,63 @@ For example, suppose the input for a three-by-six grid is the following:
 Considering the edges of the matrix as boundaries, this divides the grid into three triangles, so you should return 3.
 """
 
+# Triangle pairs (N=0, E=1, S=2, W=3) joined inside a cell, by the cell's character;
+# anything other than a slash is treated as an empty cell
+_OPEN_CELL_JOINS = ((0, 1), (1, 2), (2, 3))
+_CELL_JOINS = {
+    '/': ((0, 3), (1, 2)),
+    '\\': ((0, 1), (2, 3)),
+}
+
 class RegionCounter:
     def __init__(self, grid):
         self.rows = len(grid)
         self.cols = len(grid[0]) if grid else 0
         self.grid = grid
-        self.visited = set()
-        self.expanded_grid = [[0] * (3 * self.cols) for _ in range(3 * self.rows)]
-        self._expand_grid()
+        # Each cell is split into 4 triangles (N=0, E=1, S=2, W=3) tracked by union-find
+        self.parent = []
+        self.rank = []
     
-    def _expand_grid(self):
-        """Expands each cell into a 3x3 block for better region tracking."""
-        for r in range(self.rows):
-            for c in range(self.cols):
-                base_r, base_c = r * 3, c * 3
-                if self.grid[r][c] == '/':
-                    self.expanded_grid[base_r][base_c + 2] = 1
-                    self.expanded_grid[base_r + 1][base_c + 1] = 1
-                    self.expanded_grid[base_r + 2][base_c] = 1
-                elif self.grid[r][c] == '\\':
-                    self.expanded_grid[base_r][base_c] = 1
-                    self.expanded_grid[base_r + 1][base_c + 1] = 1
-                    self.expanded_grid[base_r + 2][base_c + 2] = 1
+    def _find(self, x):
+        """Find the root of x, halving the path as we go."""
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
     
-    def _dfs(self, r, c):
-        """Standard DFS traversal to explore a region."""
-        if (r < 0 or c < 0 or r >= 3 * self.rows or c >= 3 * self.cols or 
-            self.expanded_grid[r][c] == 1 or (r, c) in self.visited):
-            return
-        self.visited.add((r, c))
-        
-        # Move in all 4 directions
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        for dr, dc in directions:
-            self._dfs(r + dr, c + dc)
+    def _union(self, a, b):
+        """Merge the sets containing a and b using union by rank; returns True if they were separate."""
+        ra, rb = self._find(a), self._find(b)
+        if ra == rb:
+            return False
+        rank = self.rank
+        if rank[ra] < rank[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        if rank[ra] == rank[rb]:
+            rank[ra] += 1
+        return True
     
     def count_regions(self):
-        regions = 0
-        for r in range(3 * self.rows):
-            for c in range(3 * self.cols):
-                if (r, c) not in self.visited and self.expanded_grid[r][c] == 0:
-                    self._dfs(r, c)
-                    regions += 1
+        rows, cols, grid = self.rows, self.cols, self.grid
+        union = self._union
+        # Every triangle starts as its own region; each successful merge removes one
+        regions = 4 * rows * cols
+        self.parent = list(range(regions))
+        self.rank = [0] * regions
+        for r in range(rows):
+            row = grid[r]
+            for c in range(cols):
+                i = 4 * (r * cols + c)
+                for a, b in _CELL_JOINS.get(row[c], _OPEN_CELL_JOINS):
+                    regions -= union(i + a, i + b)
+                
+                # Join with the neighbouring cells below and to the right
+                if r + 1 < rows:
+                    regions -= union(i + 2, i + 4 * cols)  # S of this cell, N of the one below
+                if c + 1 < cols:
+                    regions -= union(i + 1, i + 4 + 3)  # E of this cell, W of the one to the right
         return regions
 
 # Example usage
@@ -1,4 +1,6 @@
 class ListNode:
+    __slots__ = ('value', 'next')
+
     def __init__(self, value=0, next=None):
         self.value = value
         self.next = next
@@ -6,38 +8,37 @@ class ListNode:
 class LinkedList:
     def __init__(self):
         self.head = None
+        self.tail = None
+        self.length = 0
     
     def append(self, value):
+        node = ListNode(value)
         if not self.head:
-            self.head = ListNode(value)
-            return
-        curr = self.head
-        while curr.next:
-            curr = curr.next
-        curr.next = ListNode(value)
+            self.head = node
+        else:
+            self.tail.next = node
+        self.tail = node
+        self.length += 1
     
     def rotate_right(self, k):
         if not self.head or k == 0:
             return
         
-        # Compute the length of the list
-        length = 1
-        tail = self.head
-        while tail.next:
-            tail = tail.next
-            length += 1
+        k = k % self.length
+        if k == 0:
+            return
         
         # Connect the tail to the head to form a cycle
-        tail.next = self.head
+        self.tail.next = self.head
         
-        # Find the new tail: (length - k % length - 1)th node
-        k = k % length
+        # Find the new tail: (length - k - 1)th node
         new_tail = self.head
-        for _ in range(length - k - 1):
+        for _ in range(self.length - k - 1):
             new_tail = new_tail.next
         
         # Set the new head and break the cycle
         self.head = new_tail.next
+        self.tail = new_tail
         new_tail.next = None
     
     def to_list(self):
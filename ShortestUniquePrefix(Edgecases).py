@@ -1,31 +1,36 @@
-class TrieNode:
-    def __init__(self):
-        self.children = {}
-        self.count = 0
-        self.is_end_of_word = False
-
 class Trie:
+    """
+    Arena trie: node i is children[i] (char -> child index), count[i] and
+    is_end_of_word[i]. Node 0 is the root.
+    """
     def __init__(self):
-        self.root = TrieNode()
+        self.children = [{}]
+        self.count = [0]
+        self.is_end_of_word = [False]
 
     def insert(self, word: str):
-        node = self.root
+        children, count = self.children, self.count
+        node = 0
         for char in word:
-            if char not in node.children:
-                node.children[char] = TrieNode()
-            node = node.children[char]
-            node.count += 1
-        node.is_end_of_word = True
+            child = children[node].get(char)
+            if child is None:
+                child = len(children)
+                children[node][char] = child
+                children.append({})
+                count.append(0)
+                self.is_end_of_word.append(False)
+            node = child
+            count[node] += 1
+        self.is_end_of_word[node] = True
 
     def find_unique_prefix(self, word: str) -> str:
-        node = self.root
-        prefix = ""
-        for char in word:
-            prefix += char
-            node = node.children[char]
-            if node.count == 1:
-                return prefix
-            return prefix
+        children, count = self.children, self.count
+        node = 0
+        for i, char in enumerate(word):
+            node = children[node][char]
+            if count[node] == 1:
+                return word[:i + 1]
+        return word  # This case occurs if the word itself is unique
         
 class ShortestUniquePrefixFinder:
     def __init__(self, words):
@@ -35,8 +40,8 @@ class ShortestUniquePrefixFinder:
             if word: #skip empty strings
                 self.trie.insert(word)
 
-        def get_unique_prefixes(self):
-            return[self.trie.find_unique_prefix(word) if word else "" for word in self.words]
+    def get_unique_prefixes(self):
+        return [self.trie.find_unique_prefix(word) if word else "" for word in self.words]
 #Add print statements to make code easier to visualize and readable in the command line#
 print("This is a statement that will print to indicate a visual aid to the user that a line of code is executed")
 print("This is another statement that will also print a visual aid to the user to show a line of code is exececuted")
\ No newline at end of file
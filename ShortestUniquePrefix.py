@@ -16,32 +16,51 @@ f
 
 """
 
-class TrieNode:
-    def __init__(self):
-        self.children = {}
-        self.count = 0
+from array import array
+
+ALPHABET_SIZE = 26  # Words are lowercase ASCII letters a-z
+_EMPTY_ROW = array('i', [0] * ALPHABET_SIZE)
+
+def _check_word(word: str):
+    if not all('a' <= char <= 'z' for char in word):
+        raise ValueError("Words must contain only lowercase letters a-z.")
 
 class Trie:
+    """
+    Flat array trie: node i's children live in children[i * 26 : i * 26 + 26]
+    and its word count in count[i]. Node 0 is the root, so 0 also means "no child".
+    """
     def __init__(self):
-        self.root = TrieNode()
+        self.children = array('i', _EMPTY_ROW)
+        self.count = array('i', [0])
     
     def insert(self, word: str):
-        node = self.root
+        # Checked up front, so a rejected word leaves the counts untouched
+        _check_word(word)
+        children, count = self.children, self.count
+        node = 0
         for char in word:
-            if char not in node.children:
-                node.children[char] = TrieNode()
-            node = node.children[char]
-            node.count += 1
+            slot = node * ALPHABET_SIZE + ord(char) - 97
+            child = children[slot]
+            if child == 0:
+                child = len(count)
+                children.extend(_EMPTY_ROW)
+                count.append(0)
+                children[slot] = child
+            node = child
+            count[node] += 1
     
     def find_unique_prefix(self, word: str) -> str:
-        node = self.root
-        prefix = ""
-        for char in word:
-            prefix += char
-            node = node.children[char]
-            if node.count == 1:
-                return prefix
-        return prefix  # This case occurs if the word itself is unique
+        _check_word(word)
+        children, count = self.children, self.count
+        node = 0
+        for i, char in enumerate(word):
+            node = children[node * ALPHABET_SIZE + ord(char) - 97]
+            if node == 0:
+                raise KeyError(word)
+            if count[node] == 1:
+                return word[:i + 1]
+        return word  # This case occurs if the word itself is unique
 
 class ShortestUniquePrefixFinder:
     def __init__(self, words):
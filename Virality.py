@@ -19,10 +19,10 @@ Key ideas you can tune:
 
 from __future__ import annotations
 from dataclasses import dataclass
-from enum import Enum
-from typing import Dict, List, Tuple, Optional
+from enum import IntEnum
+from itertools import chain
+from typing import List, Tuple, Optional
 
-import random
 import math
 
 import numpy as np
@@ -30,7 +30,7 @@ import networkx as nx
 import matplotlib.pyplot as plt
 
 
-class State(Enum):
+class State(IntEnum):
     SUSCEPTIBLE = 0  # hasn't seen
     EXPOSED = 1      # has seen, may share after delay
     SHARER = 2       # currently sharing
@@ -75,19 +75,33 @@ class Params:
 class ViralSpreadSim:
     def __init__(self, params: Params):
         self.p = params
-        self.rng = random.Random(self.p.rng_seed)
+        self.np_rng = np.random.default_rng(self.p.rng_seed)
         np.random.seed(self.p.rng_seed)
 
         self.G = self._build_network()
-        self.state: Dict[int, State] = {u: State.SUSCEPTIBLE for u in self.G.nodes()}
+        self.indptr, self.indices = self._build_csr()
+
+        # Per-node state, indexed by node id (0..n-1)
+        n = self.G.number_of_nodes()
+        self.state = np.full(n, State.SUSCEPTIBLE, dtype=np.int8)
 
         # Per-node timers
-        self.exposure_delay: Dict[int, int] = {u: 0 for u in self.G.nodes()}
-        self.sharer_time_left: Dict[int, int] = {u: 0 for u in self.G.nodes()}
+        self.exposure_delay = np.zeros(n, dtype=np.int32)
+        self.sharer_time_left = np.zeros(n, dtype=np.int32)
+
+        # Active node ids and per-state totals, kept in sync with every transition
+        self.sharers = np.empty(0, dtype=np.int64)
+        self.exposed = np.empty(0, dtype=np.int64)
+        self.counts = [n, 0, 0, 0]  # indexed by State
 
         self.t = 0
         self.history: List[Tuple[int, int, int, int]] = []  # (S,E,I,R)
 
+        # Per-tick spread probabilities, precomputed for every tick run() can reach
+        ticks = range(self.p.max_ticks + 1)
+        self._p_expose_by_tick = [self._effective_exposure_p(t) for t in ticks]
+        self._p_share_by_tick = [self._effective_share_p(t) for t in ticks]
+
         self._seed_initial_sharers()
 
     def _build_network(self) -> nx.Graph:
@@ -103,24 +117,49 @@ class ViralSpreadSim:
 
         raise ValueError(f"Unknown network_type='{self.p.network_type}'. Use 'er', 'ba', or 'ws'.")
 
-    def _sample_nonnegative_int(self, mean: float, std: float, minimum: int = 0) -> int:
+    def _build_csr(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compressed sparse row adjacency: the neighbors of u are
+        indices[indptr[u]:indptr[u + 1]].
+        """
+        n = self.G.number_of_nodes()
+        adj = [tuple(self.G[u]) for u in range(n)]  # one NetworkX lookup per node
+        degrees = np.fromiter(map(len, adj), dtype=np.int64, count=n)
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(degrees, out=indptr[1:])
+        indices = np.fromiter(chain.from_iterable(adj), dtype=np.int64, count=int(indptr[-1]))
+        return indptr, indices
+
+    def _neighbors_of(self, nodes: np.ndarray) -> np.ndarray:
+        """All neighbors of the given nodes, concatenated (with repeats)."""
+        starts = self.indptr[nodes]
+        lengths = self.indptr[nodes + 1] - starts
+        # Shift each row's start back by the number of edges gathered before it,
+        # so adding a running edge counter walks every row in turn
+        starts -= np.cumsum(lengths) - lengths
+        edge_pos = np.repeat(starts, lengths)
+        edge_pos += np.arange(edge_pos.size)
+        return self.indices[edge_pos]
+
+    def _sample_nonnegative_ints(self, mean: float, std: float, size: int, minimum: int = 0) -> np.ndarray:
+        """Draw `size` rounded Gaussian integers in one call, clipped below at `minimum`."""
         if mean <= 0:
-            return minimum
+            return np.full(size, minimum, dtype=np.int32)
         if std <= 0:
-            return max(minimum, int(round(mean)))
-        x = int(round(self.rng.gauss(mean, std)))
-        return max(minimum, x)
+            return np.full(size, max(minimum, int(round(mean))), dtype=np.int32)
+        x = np.rint(self.np_rng.normal(mean, std, size))
+        return np.maximum(minimum, x).astype(np.int32)
 
     def _seed_initial_sharers(self) -> None:
-        candidates = list(self.G.nodes())
-        self.rng.shuffle(candidates)
-        seeds = candidates[: self.p.initial_sharers]
-
-        for u in seeds:
-            self.state[u] = State.SHARER
-            self.sharer_time_left[u] = self._sample_nonnegative_int(
-                self.p.infectious_period_mean, self.p.infectious_period_std, minimum=1
-            )
+        n = self.state.size
+        k = min(self.p.initial_sharers, n)
+        self.sharers = self.np_rng.choice(n, size=k, replace=False).astype(np.int64)
+        self.state[self.sharers] = State.SHARER
+        self.sharer_time_left[self.sharers] = self._sample_nonnegative_ints(
+            self.p.infectious_period_mean, self.p.infectious_period_std, k, minimum=1
+        )
+        self.counts[State.SUSCEPTIBLE] -= k
+        self.counts[State.SHARER] += k
 
     def _novelty_multiplier(self, t: int) -> float:
         """
@@ -159,60 +198,64 @@ class ViralSpreadSim:
         3) Sharers count down infectious period; then recover
         """
         t = self.t
-        p_expose = self._effective_exposure_p(t)
-        p_share = self._effective_share_p(t)
-
-        sharers = [u for u, s in self.state.items() if s == State.SHARER]
-        newly_exposed: List[int] = []
-
-        # 1) Exposure
-        for u in sharers:
-            for v in self.G.neighbors(u):
-                if self.state[v] == State.SUSCEPTIBLE:
-                    if self.rng.random() < p_expose:
-                        newly_exposed.append(v)
-
-        # Apply exposures (dedupe)
-        for v in set(newly_exposed):
-            self.state[v] = State.EXPOSED
-            self.exposure_delay[v] = self._sample_nonnegative_int(
-                self.p.exposure_delay_mean, self.p.exposure_delay_std, minimum=0
-            )
+        if t < len(self._p_expose_by_tick):
+            p_expose = self._p_expose_by_tick[t]
+            p_share = self._p_share_by_tick[t]
+        else:
+            p_expose = self._effective_exposure_p(t)
+            p_share = self._effective_share_p(t)
+
+        state = self.state
+        counts = self.counts
+
+        # 1) Exposure: one Bernoulli draw per edge from a sharer to a susceptible neighbor
+        targets = self._neighbors_of(self.sharers)
+        targets = targets[state[targets] == State.SUSCEPTIBLE]
+        newly_exposed = np.unique(targets[self.np_rng.random(targets.size) < p_expose])
+
+        # Apply exposures (deduped above)
+        state[newly_exposed] = State.EXPOSED
+        self.exposure_delay[newly_exposed] = self._sample_nonnegative_ints(
+            self.p.exposure_delay_mean, self.p.exposure_delay_std, newly_exposed.size, minimum=0
+        )
+        counts[State.SUSCEPTIBLE] -= newly_exposed.size
+        counts[State.EXPOSED] += newly_exposed.size
 
         # 2) EXPOSED -> SHARER
-        exposed = [u for u, s in self.state.items() if s == State.EXPOSED]
-        for u in exposed:
-            if self.exposure_delay[u] > 0:
-                self.exposure_delay[u] -= 1
-                continue
-            if self.rng.random() < p_share:
-                self.state[u] = State.SHARER
-                self.sharer_time_left[u] = self._sample_nonnegative_int(
-                    self.p.infectious_period_mean, self.p.infectious_period_std, minimum=1
-                )
+        exposed = np.concatenate((self.exposed, newly_exposed))
+        waiting = self.exposure_delay[exposed] > 0
+        self.exposure_delay[exposed[waiting]] -= 1
+        ready = exposed[~waiting]
+        new_sharers = ready[self.np_rng.random(ready.size) < p_share]
+        state[new_sharers] = State.SHARER
+        self.sharer_time_left[new_sharers] = self._sample_nonnegative_ints(
+            self.p.infectious_period_mean, self.p.infectious_period_std, new_sharers.size, minimum=1
+        )
+        self.exposed = exposed[state[exposed] == State.EXPOSED]
+        counts[State.EXPOSED] -= new_sharers.size
+        counts[State.SHARER] += new_sharers.size
 
         # 3) SHARER countdown -> RECOVERED
-        sharers = [u for u, s in self.state.items() if s == State.SHARER]
-        for u in sharers:
-            self.sharer_time_left[u] -= 1
-            if self.sharer_time_left[u] <= 0:
-                self.state[u] = State.RECOVERED
+        sharers = np.concatenate((self.sharers, new_sharers))
+        self.sharer_time_left[sharers] -= 1
+        done = self.sharer_time_left[sharers] <= 0
+        recovered = sharers[done]
+        state[recovered] = State.RECOVERED
+        self.sharers = sharers[~done]
+        counts[State.SHARER] -= recovered.size
+        counts[State.RECOVERED] += recovered.size
 
         self._record()
         self.t += 1
 
     def _record(self) -> None:
-        s = sum(1 for v in self.state.values() if v == State.SUSCEPTIBLE)
-        e = sum(1 for v in self.state.values() if v == State.EXPOSED)
-        i = sum(1 for v in self.state.values() if v == State.SHARER)
-        r = sum(1 for v in self.state.values() if v == State.RECOVERED)
-        self.history.append((s, e, i, r))
+        self.history.append(tuple(self.counts))
 
     def run(self) -> None:
         self._record()
         for _ in range(self.p.max_ticks):
             if self.p.stop_when_no_sharers:
-                if sum(1 for v in self.state.values() if v == State.SHARER) == 0:
+                if self.counts[State.SHARER] == 0:
                     break
             self.step()
 
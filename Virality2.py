@@ -26,6 +26,8 @@ from typing import Optional
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 from matplotlib.widgets import Slider, Button
 
 import matplotlib
@@ -38,6 +40,23 @@ class State(IntEnum):
     SPREADER = 2     # Red (got it from others)
     RECOVERED = 3    # Gray
 
+# RGBA per State, indexed by state value
+_COLOR_LUT = np.array(
+    [
+        [0.2, 0.8, 0.2, 1.0],  # Green
+        [0.2, 0.4, 1.0, 1.0],  # Blue
+        [0.9, 0.2, 0.2, 1.0],  # Red
+        [0.5, 0.5, 0.5, 0.5],  # Gray (faded)
+    ],
+    dtype=np.float32,
+)
+
+# Animation cadence, in frames: movement alone is redrawn every
+# POSITION_REDRAW_EVERY frames and the chart every CHART_REDRAW_EVERY;
+# a state change always redraws the scatter on the frame it happens.
+POSITION_REDRAW_EVERY = 2
+CHART_REDRAW_EVERY = 5
+
 @dataclass
 class Params:
     n: int = 800
@@ -50,6 +69,21 @@ class Params:
     max_history: int = 600     # points shown in chart
 
 
+def _aligned_empty(n: int, dtype, align: int = 64) -> np.ndarray:
+    """Uninitialised 1-D array whose data starts on an `align`-byte boundary."""
+    itemsize = np.dtype(dtype).itemsize
+    buf = np.empty(n * itemsize + align, dtype=np.uint8)
+    offset = -buf.ctypes.data % align
+    return buf[offset : offset + n * itemsize].view(dtype)
+
+
+def _aligned_rows(rows: int, n: int, dtype, align: int = 64) -> np.ndarray:
+    """Uninitialised (rows, n) array; every row starts on an `align`-byte boundary."""
+    per_line = align // np.dtype(dtype).itemsize
+    stride = -(-n // per_line) * per_line
+    return _aligned_empty(rows * stride, dtype, align).reshape(rows, stride)[:, :n]
+
+
 class ViralWorld:
     def __init__(self, params: Params, rng_seed: int = 42):
         self.p = params
@@ -57,21 +91,21 @@ class ViralWorld:
         self.t = 0
         self.paused = False
 
-        # Agent attributes
-        self.x = self.rng.uniform(0, self.p.world_size, size=self.p.n)
-        self.y = self.rng.uniform(0, self.p.world_size, size=self.p.n)
+        # Set by step() when something visible changed; cleared by the UI once drawn
+        self.state_dirty = True
+        self.pos_dirty = True
+
+        # Agent attributes (one contiguous array per attribute)
+        self._allocate_agents()
+        self._place_agents()
 
-        self.state = np.full(self.p.n, State.UNAFFECTED, dtype=np.int8)
-        self.time_left = np.zeros(self.p.n, dtype=np.int16)
+        self.state.fill(State.UNAFFECTED)
+        self.time_left.fill(0)
 
         self._seed_initial_sharers(self.p.initial_sharers)
 
-        # History for the chart
-        self.hist_t = []
-        self.hist_S = []
-        self.hist_E = []
-        self.hist_I = []
-        self.hist_R = []
+        # History for the chart: ring buffer of (t, S, E, I, R) columns
+        self._allocate_history()
         self._record()
 
     def reset(self, params: Optional[Params] = None):
@@ -80,22 +114,58 @@ class ViralWorld:
 
         self.t = 0
         self.paused = False
+        self.state_dirty = True
+        self.pos_dirty = True
 
-        self.x = self.rng.uniform(0, self.p.world_size, size=self.p.n)
-        self.y = self.rng.uniform(0, self.p.world_size, size=self.p.n)
+        if self.x.size != self.p.n:
+            self._allocate_agents()
+        self._place_agents()
 
         self.state.fill(State.UNAFFECTED)
         self.time_left.fill(0)
 
         self._seed_initial_sharers(self.p.initial_sharers)
 
-        self.hist_t.clear()
-        self.hist_S.clear()
-        self.hist_E.clear()
-        self.hist_I.clear()
-        self.hist_R.clear()
+        if self._hist.shape[1] != self.p.max_history:
+            self._allocate_history()
         self._record()
 
+    def _allocate_history(self):
+        # Tick t is always stored in column t % max_history
+        self._hist = np.zeros((5, self.p.max_history), dtype=np.int32)
+
+    def history(self) -> np.ndarray:
+        """Recorded (t, S, E, I, R) rows, oldest column first."""
+        newest = self.t % self._hist.shape[1]
+        if newest == self.t:
+            return self._hist[:, : newest + 1]
+        return np.concatenate((self._hist[:, newest + 1 :], self._hist[:, : newest + 1]), axis=1)
+
+    def _allocate_agents(self):
+        n = self.p.n
+        # x and y are the rows of one buffer, so movement updates both in one pass
+        self.xy = _aligned_rows(2, n, np.float32)
+        self.x, self.y = self.xy
+        self.state = _aligned_empty(n, np.int8)
+        self.time_left = _aligned_empty(n, np.int16)
+
+        # Per-tick scratch buffers, reused by step()
+        self._angles = _aligned_empty(n, np.float32)
+        self._dxy = _aligned_rows(2, n, np.float32)
+        self._dx, self._dy = self._dxy
+        self._wrap = _aligned_rows(2, n, np.bool_)
+        self._is_sharer = _aligned_empty(n, np.bool_)
+        self._is_suscept = _aligned_empty(n, np.bool_)
+        self._near = _aligned_empty(n, np.bool_)
+        self._roll = _aligned_empty(n, np.float32)
+        self._fire = _aligned_empty(n, np.bool_)
+
+    def _place_agents(self):
+        """Scatter agents uniformly over the world, in place."""
+        for pos in self.xy:
+            self.rng.random(out=pos, dtype=np.float32)
+        self.xy *= self.p.world_size
+
     def _seed_initial_sharers(self, k: int):
         k = int(np.clip(k, 1, self.p.n))
         idx = self.rng.choice(self.p.n, size=k, replace=False)
@@ -104,86 +174,147 @@ class ViralWorld:
 
 
     def _record(self):
-        S = int(np.sum(self.state == State.UNAFFECTED))
-        I0 = int(np.sum(self.state == State.INITIAL))
-        I1 = int(np.sum(self.state == State.SPREADER))
-        R = int(np.sum(self.state == State.RECOVERED))
-
-        self.hist_t.append(self.t)
-        self.hist_S.append(S)
-        self.hist_E.append(I0)   # lineE = Initial (blue)
-        self.hist_I.append(I1)   # lineI = Spreaders (red)
-        self.hist_R.append(R)
-
-        if len(self.hist_t) > self.p.max_history:
-            self.hist_t = self.hist_t[-self.p.max_history:]
-            self.hist_S = self.hist_S[-self.p.max_history:]
-            self.hist_E = self.hist_E[-self.p.max_history:]
-            self.hist_I = self.hist_I[-self.p.max_history:]
-            self.hist_R = self.hist_R[-self.p.max_history:]
+        # One pass over state; State values are the dense range 0..3
+        counts = np.bincount(self.state.view(np.uint8), minlength=len(State))
+
+        # Rows: t, S, E = Initial (blue), I = Spreaders (red), R
+        col = self.t % self._hist.shape[1]
+        self._hist[0, col] = self.t
+        self._hist[1:, col] = counts
+
+    def _grid_shape(self):
+        """Cells per side and cell width for a torus grid with cells at least exposure_radius wide."""
+        nc = max(1, int(self.p.world_size // self.p.exposure_radius))
+        return nc, self.p.world_size / nc
+
+    def _cells_of(self, idx, nc, cell):
+        # The modulo folds x == world_size (possible after float wrap) back into cell 0
+        gx = (self.x[idx] // cell).astype(np.int64) % nc
+        gy = (self.y[idx] // cell).astype(np.int64) % nc
+        return gx, gy
+
+    def _build_grid(self, agents):
+        """
+        Bin the given agents into the torus grid.
+        Agents in cell c are cell_order[cell_start[c]:cell_start[c + 1]].
+        """
+        nc, cell = self._grid_shape()
+        gx, gy = self._cells_of(agents, nc, cell)
+        key = gx + gy * nc
+        ncells = nc * nc
+        if ncells <= 1 << 16:
+            # Stable sort of 16-bit keys is a radix sort: linear, no comparisons
+            key = key.astype(np.uint16)
+        order = np.argsort(key, kind="stable")
+        cell_start = np.zeros(ncells + 1, dtype=np.intp)
+        np.cumsum(np.bincount(key, minlength=ncells), out=cell_start[1:])
+        return cell_start, agents[order]
+
+    def _near_sharers(self, sharers, targets, out):
+        """
+        Fill `out` with a mask of the `targets` agents that are within exposure_radius
+        (torus distance) of any sharer.
+        """
+        out.fill(False)
+        if targets.size == 0:
+            return out
+
+        # Only targets are binned, so pairs that could never be exposed are skipped outright
+        nc, cell = self._grid_shape()
+        cell_start, cell_order = self._build_grid(targets)
+        gx, gy = self._cells_of(sharers, nc, cell)
+        radius2 = np.float32(self.p.exposure_radius ** 2)
+
+        # Only agents in the 3x3 block of cells around a sharer can be within radius;
+        # gather every (sharer, neighbour cell) pair in one pass
+        offsets = np.arange(-1, 2)
+        cx = (gx[:, None, None] + offsets[:, None]) % nc
+        cy = (gy[:, None, None] + offsets[None, :]) % nc
+        cells = (cx + cy * nc).ravel()
+        cell_sharer = np.repeat(sharers, offsets.size * offsets.size)
+
+        starts = cell_start[cells]
+        lengths = cell_start[cells + 1] - starts
+        starts -= np.cumsum(lengths) - lengths
+        pos = np.repeat(starts, lengths)
+        pos += np.arange(pos.size)
+        cand = cell_order[pos]
+        src = np.repeat(cell_sharer, lengths)
+
+        # Torus distance: minimum-image convention, shift each offset by the
+        # nearest whole number of world widths
+        world = np.float32(self.p.world_size)
+        inv_world = np.float32(1.0 / self.p.world_size)
+        dx = self.x[cand] - self.x[src]
+        dy = self.y[cand] - self.y[src]
+        for d in (dx, dy):
+            shift = d * inv_world
+            np.rint(shift, out=shift)
+            shift *= world
+            d -= shift
+
+        # Squared distance, accumulated in dx's buffer
+        d2 = np.square(dx, out=dx)
+        d2 += np.square(dy, out=dy)
+        out[cand[d2 <= radius2]] = True
+        return out
+
     def step(self):
         if self.paused:
             return
 
         # 1) Move: random walk with wrap-around (torus world like NetLogo)
-        angles = self.rng.uniform(0, 2 * np.pi, size=self.p.n)
-        dx = self.p.speed * np.cos(angles)
-        dy = self.p.speed * np.sin(angles)
-
-        self.x = (self.x + dx) % self.p.world_size
-        self.y = (self.y + dy) % self.p.world_size
+        if self.p.speed > 0:
+            self.pos_dirty = True
+            angles = self._angles
+            self.rng.random(out=angles, dtype=np.float32)
+            angles *= 2 * np.pi
+            np.cos(angles, out=self._dx)
+            np.sin(angles, out=self._dy)
+            # Both displacement rows share one buffer, so one pass scales them
+            self._dxy *= self.p.speed
+
+            # In place, so positions stay float32 in their aligned buffers
+            self.xy += self._dxy
+
+            # A step is never longer than the world, so each coordinate is at
+            # most one world_size out of range: fold it back with a compare and
+            # a masked add instead of a float modulo.
+            size = np.float32(self.p.world_size)
+            xy, wrap = self.xy, self._wrap
+            np.greater_equal(xy, size, out=wrap)
+            np.subtract(xy, size, out=xy, where=wrap)
+            np.less(xy, 0, out=wrap)
+            np.add(xy, size, out=xy, where=wrap)
 
         # 2) Spread: Susceptible become Exposed if within radius of any Sharer
-        sharers = np.where(
-        (self.state == State.INITIAL) | (self.state == State.SPREADER))[0]
+        is_sharer, is_suscept = self._is_sharer, self._is_suscept
+        np.equal(self.state, State.INITIAL, out=is_sharer)
+        np.equal(self.state, State.SPREADER, out=is_suscept)  # used as scratch here
+        np.logical_or(is_sharer, is_suscept, out=is_sharer)
+        np.equal(self.state, State.UNAFFECTED, out=is_suscept)
+
+        sharers = np.flatnonzero(is_sharer)
         if sharers.size > 0:
-            S_idx = np.where(self.state == State.UNAFFECTED)[0]
-            if S_idx.size > 0:
-                # Compute distance to nearest sharer (vectorized in blocks to be memory-safe)
-                radius2 = float(self.p.exposure_radius ** 2)
-
-                # Blocked computation: for S nodes, test if any sharer within radius
-                # Use broadcasting in blocks to avoid huge matrices
-                block = 2000  # tune if needed
-                exposed_now = []
-
-                sx = self.x[sharers]
-                sy = self.y[sharers]
-
-                for start in range(0, S_idx.size, block):
-                    chunk = S_idx[start : start + block]
-                    cx = self.x[chunk][:, None]
-                    cy = self.y[chunk][:, None]
-
-                    # Torus distance: consider wrap-around
-                    dx = np.abs(cx - sx[None, :])
-                    dy = np.abs(cy - sy[None, :])
-
-                    dx = np.minimum(dx, self.p.world_size - dx)
-                    dy = np.minimum(dy, self.p.world_size - dy)
-
-                    d2 = dx * dx + dy * dy
-                    near_any = np.any(d2 <= radius2, axis=1)
-
-                    if np.any(near_any):
-                        candidates = chunk[near_any]
-                        # apply probability
-                        roll = self.rng.random(size=candidates.size)
-                        to_expose = candidates[roll < self.p.exposure_p]
-                        if to_expose.size:
-                            exposed_now.append(to_expose)
-
-                if exposed_now:
-                    exposed_now = np.concatenate(exposed_now)
-                    self.state[exposed_now] = State.SPREADER
-                    self.time_left[exposed_now] = self.p.infectious_period
-
-        # 4) Sharer countdown -> Recovered
-        active = np.where((self.state == State.INITIAL) | (self.state == State.SPREADER))[0]
-        if active.size > 0:
-            self.time_left[active] -= 1
-            done = active[self.time_left[active] <= 0]
-            if done.size:
+            near = self._near_sharers(sharers, np.flatnonzero(is_suscept), out=self._near)
+            # apply probability: one roll per agent, fused with the proximity test
+            self.rng.random(out=self._roll, dtype=np.float32)
+            np.less(self._roll, self.p.exposure_p, out=self._fire)
+            np.logical_and(near, self._fire, out=self._fire)
+            exposed_now = np.flatnonzero(self._fire)
+            if exposed_now.size:
+                self.state_dirty = True
+                self.state[exposed_now] = State.SPREADER
+                self.time_left[exposed_now] = self.p.infectious_period
+                # New spreaders count down from this tick as well
+                np.logical_or(is_sharer, self._fire, out=is_sharer)
+
+            # 4) Sharer countdown -> Recovered, reusing the sharer mask from above
+            self.time_left -= is_sharer
+            done = np.less_equal(self.time_left, 0, out=self._fire)
+            np.logical_and(done, is_sharer, out=done)
+            if done.any():
+                self.state_dirty = True
                 self.state[done] = State.RECOVERED
 
         self.t += 1
@@ -213,17 +344,23 @@ def build_ui_and_run():
     ax_world.grid(True)
 
     # Scatter (we'll update colors and positions)
-    scat = ax_world.scatter(world.x, world.y, s=10)
+    scat = ax_world.scatter(world.x, world.y, s=10, edgecolors="none")
 
     # Chart plot setup
     ax_chart.set_title("Counts over time")
     ax_chart.set_xlabel("Tick")
     ax_chart.set_ylabel("Count")
-    (lineS,) = ax_chart.plot([], [], label="S")
-    (lineE,) = ax_chart.plot([], [], label="Initial (blue)")
-    (lineI,) = ax_chart.plot([], [], label="Spreaders (red)")
-    (lineR,) = ax_chart.plot([], [], label="R")
-    ax_chart.legend(loc="upper right")
+    # All four series in one artist: S, Initial (blue), Spreaders (red), R
+    line_colors = ["C0", "C1", "C2", "C3"]
+    lines = LineCollection([], colors=line_colors)
+    ax_chart.add_collection(lines)
+    ax_chart.legend(
+        handles=[
+            Line2D([], [], color=color, label=label)
+            for color, label in zip(line_colors, ["S", "Initial (blue)", "Spreaders (red)", "R"])
+        ],
+        loc="upper right",
+    )
     ax_chart.grid(True)
 
     # --- Controls: place sliders inside the right panel using inset axes ---
@@ -247,14 +384,16 @@ def build_ui_and_run():
     b_pause = add_button(0.28, "Pause/Resume")
 
     # Simple text readout
-    ax_text = ax_controls.inset_axes([0.08, 0.05, 0.84, 0.18])
+    ax_text = ax_controls.inset_axes([0.08, 0.0, 0.84, 0.24])
     ax_text.axis("off")
-    status_text = ax_text.text(0.0, 0.75, "", fontsize=10)
+    # Kept inside ax_text's box so blitting that box fully repaints it
+    status_text = ax_text.text(0.0, 1.0, "", fontsize=10, va="top")
     hint_text = ax_text.text(
         0.0,
-        0.15,
+        0.0,
         "Tip: Try BA-like virality by increasing radius slightly and raising exposure/share.",
         fontsize=9,
+        va="bottom",
     )
 
     def apply_slider_params():
@@ -271,55 +410,70 @@ def build_ui_and_run():
     def on_pause(_event):
         world.paused = not world.paused
 
+    # With blitting only the animated artists are redrawn each frame, so the chart
+    # axes are rescaled (with a full redraw) only when the data outgrows them
+    x_headroom = max(world.p.max_history // 10, 1)
+
+    def rescale_chart(t, ymax):
+        """Update chart limits if needed; returns True when they changed."""
+        x0, x1 = ax_chart.get_xlim()
+        _, y1 = ax_chart.get_ylim()
+        changed = False
+        if t[0] < x0 or t[-1] + 1 > x1:
+            ax_chart.set_xlim(t[0], t[-1] + 1 + x_headroom)
+            changed = True
+        if ymax * 1.05 > y1 or ymax * 1.05 < 0.5 * y1:
+            ax_chart.set_ylim(0, ymax * 1.05)
+            changed = True
+        return changed
+
     b_reset.on_clicked(on_reset)
     b_pause.on_clicked(on_pause)
 
-    def update(_frame):
+    def update(frame):
         # Update params live (without resetting)
         apply_slider_params()
 
         world.step()
 
-        # Update scatter positions + colors
-        offsets = np.column_stack([world.x, world.y])
-        scat.set_offsets(offsets)
-
-        # Map states to colors
-        colors = np.zeros((world.p.n, 4), dtype=float)
+        # Update scatter positions + colors, only when something moved or changed.
+        # Skipped frames still return the artists unchanged: an empty tuple would
+        # make FuncAnimation fall back to a full, unblitted redraw.
+        if world.state_dirty or (world.pos_dirty and frame % POSITION_REDRAW_EVERY == 0):
+            # (n, 2) view of the world's position rows; no per-frame stacking
+            scat.set_offsets(world.xy.T)
+            world.pos_dirty = False
 
-        colors[world.state == State.UNAFFECTED] = [0.2, 0.8, 0.2, 1.0]  # Green
-        colors[world.state == State.INITIAL]    = [0.2, 0.4, 1.0, 1.0]  # Blue
-        colors[world.state == State.SPREADER]   = [0.9, 0.2, 0.2, 1.0]  # Red
-        colors[world.state == State.RECOVERED]  = [0.5, 0.5, 0.5, 0.5]  # Gray (faded)
-        scat.set_facecolors(colors)
-        scat.set_edgecolors(colors)
+        if world.state_dirty:
+            # Map states to colors
+            scat.set_facecolors(_COLOR_LUT[world.state])
+            world.state_dirty = False
 
+        if frame % CHART_REDRAW_EVERY:
+            return scat, lines, status_text
 
         # Update chart
-        t = np.array(world.hist_t)
-        lineS.set_data(t, np.array(world.hist_S))
-        lineE.set_data(t, np.array(world.hist_E))
-        lineI.set_data(t, np.array(world.hist_I))
-        lineR.set_data(t, np.array(world.hist_R))
+        hist = world.history()
+        t = hist[0]
+        # (4, len, 2) array of (tick, count) points, one row per series
+        lines.set_segments(np.stack((np.broadcast_to(t, hist[1:].shape), hist[1:]), axis=-1))
 
-        ax_chart.set_xlim(t.min() if t.size else 0, (t.max() if t.size else 1) + 1)
-        ymax = max(max(world.hist_S), max(world.hist_E), max(world.hist_I), max(world.hist_R), 1)
-        ax_chart.set_ylim(0, ymax * 1.05)
+        ymax = max(int(hist[1:].max()), 1)
+        if rescale_chart(t, ymax):
+            # Repaint ticks and background now, before the blit caches this view
+            fig.canvas.draw()
 
         # Status text
-        S = world.hist_S[-1]
-        E = world.hist_E[-1]
-        I = world.hist_I[-1]
-        R = world.hist_R[-1]
+        S, E, I, R = hist[1:, -1]
         status_text.set_text(
             f"Tick: {world.t}\n"
             f"S: {S}  E: {E}  I: {I}  R: {R}\n"
             f"Paused: {world.paused}"
         )
 
-        return scat, lineS, lineE, lineI, lineR, status_text
+        return scat, lines, status_text
 
-    ani = FuncAnimation(fig, update, interval=100, blit=False, cache_frame_data=False)
+    ani = FuncAnimation(fig, update, interval=100, blit=True, cache_frame_data=False)
     fig._ani = ani
     plt.show()
 